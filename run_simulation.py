@@ -5,14 +5,23 @@ import numpy as np
 
 from src.constellation   import walker_delta, walker_star, custom
 from src.propagation     import propagate_keplerian
-from src.coverage        import instantaneous_coverage
-from src.analysis        import coverage_fraction, time_statistics
+from src.coverage        import coverage_time_series
+from src.analysis        import time_statistics
+from src.propagation_cuda import available as gpu_available
+from src.propagation_cuda import propagate_keplerian_gpu, coverage_time_series_gpu
 from src.utils           import load_config, make_time_grid
 
+# Epochs per streamed block in main()
+TIME_BLOCK = 256
 
-def main(config_file, outdir):
+
+def main(config_file, outdir, gpu=False):
     cfg = load_config(config_file)
 
+    # effective beam cone: the narrower of divergence and scan half-angles
+    half_deg = min(cfg['beams']['divergence_half_angle'], cfg['beams']['scan_half_angle'])
+    cos_thr  = np.cos(np.deg2rad(half_deg))
+
     # 1) Build sats
     c = cfg['constellation']
     if c['type'] == 'delta':
@@ -42,27 +51,27 @@ def main(config_file, outdir):
     t0      = 0.0
     times   = make_time_grid(t0, cfg['simulation']['duration'], cfg['simulation']['dt'])
 
-    # 4) Propagate
-    sat_pos = propagate_keplerian(elems, times)
-    tgt_pos = propagate_keplerian(tgt_elems, times)
-
-    # 5) Coverage per epoch
-    cov_frac = []
-    for k, t in enumerate(times):
-        mask = instantaneous_coverage(
-            sat_pos[:,k,:], tgt_pos[:,k,:],
-            np.deg2rad(cfg['beams']['divergence_half_angle']),
-            np.deg2rad(cfg['beams']['scan_half_angle'])
-        )
-        cov_frac.append(coverage_fraction(mask))
-    cov_frac = np.array(cov_frac)
+    # 4) Propagate & 5) coverage, streamed over blocks of epochs so only
+    #    O(N * TIME_BLOCK) positions are held; each block's CSV rows are
+    #    appended as soon as they are computed
+    if gpu:
+        propagate, coverage = propagate_keplerian_gpu, coverage_time_series_gpu
+    else:
+        propagate, coverage = propagate_keplerian, coverage_time_series
+    os.makedirs(outdir, exist_ok=True)
+    cov_frac = np.empty(times.size)
+    with open(os.path.join(outdir, 'coverage_time_series.csv'), 'w') as f:
+        for k0 in range(0, times.size, TIME_BLOCK):
+            k1 = min(k0 + TIME_BLOCK, times.size)
+            sat_pos = propagate(elems, times[k0:k1])
+            tgt_pos = propagate(tgt_elems, times[k0:k1])
+            coverage(sat_pos, tgt_pos, cos_thr, out=cov_frac[k0:k1])
+            np.savetxt(f, np.vstack((times[k0:k1], cov_frac[k0:k1])).T,
+                       header='time_s,coverage_fraction' if k0 == 0 else '',
+                       delimiter=',')
 
     # 6) Stats & write out
     stats = time_statistics(times, cov_frac)
-    os.makedirs(outdir, exist_ok=True)
-    np.savetxt(os.path.join(outdir, 'coverage_time_series.csv'),
-               np.vstack((times, cov_frac)).T,
-               header='time_s,coverage_fraction', delimiter=',')
     with open(os.path.join(outdir, 'coverage_stats.json'), 'w') as f:
         import json; json.dump(stats, f, indent=2)
 
@@ -73,5 +82,8 @@ if __name__ == "__main__":
     p = argparse.ArgumentParser()
     p.add_argument('--config',  required=True)
     p.add_argument('--outdir',  default='results/')
+    p.add_argument('--gpu',     action='store_true', help='use the CUDA backend (needs cupy)')
     args = p.parse_args()
-    main(args.config, args.outdir)
+    if args.gpu and not gpu_available():
+        p.error('--gpu requested but cupy or a CUDA device is not available')
+    main(args.config, args.outdir, args.gpu)
@@ -0,0 +1,61 @@
+/*
+ * Danby solver for Kepler's equation over flat arrays, loaded by
+ * src/propagation.py through ctypes.
+ *
+ * Build (from the repository root):
+ *   gcc -O3 -march=native -ffast-math -fopenmp-simd \
+ *       -fno-builtin-sin -fno-builtin-cos -fPIC \
+ *       -c src/_kepler_c.c -o src/_kepler_c.o
+ *   gcc -shared src/_kepler_c.o -o src/_kepler_c.so -lm
+ *
+ * The loops are written for the compiler's vectorizer: with -fopenmp-simd
+ * and -ffast-math GCC maps sin/cos to glibc's libmvec SIMD variants and fuses
+ * the update into FMAs on AVX2/AVX-512 targets. The -fno-builtin flags stop
+ * GCC from merging sin/cos into a scalar sincos, which blocks vectorization.
+ *
+ * Compile and link are kept separate on purpose: linking with -ffast-math
+ * (GCC < 13) pulls in crtfastmath.o, whose constructor sets FTZ/DAZ in MXCSR
+ * when the library is loaded. That would flush subnormals to zero in every
+ * later NumPy operation of the importing process, not just in this solver.
+ */
+#include <math.h>
+#include <stddef.h>
+
+/* elements per block: M, e and E of a block stay resident in L1 */
+#define BLOCK 512
+
+static void danby_block(const double *restrict M, const double *restrict e,
+                        double *restrict E, size_t n, int n_iter)
+{
+    #pragma omp simd
+    for (size_t k = 0; k < n; ++k) {
+        const double s = sin(M[k]);
+        E[k] = M[k] + 0.85 * e[k] * ((s > 0.0) - (s < 0.0));
+    }
+    /* iterations outermost so each inner loop is a straight-line SIMD body */
+    for (int it = 0; it < n_iter; ++it) {
+        #pragma omp simd
+        for (size_t k = 0; k < n; ++k) {
+            const double ecc = e[k];
+            const double s = sin(E[k]);
+            const double c = cos(E[k]);
+            const double f = E[k] - ecc * s - M[k];
+            const double fp = 1.0 - ecc * c;
+            const double fpp = ecc * s;
+            const double fppp = ecc * c;
+            const double d1 = -f / fp;
+            const double d2 = -f / (fp + 0.5 * d1 * fpp);
+            const double d3 = -f / (fp + 0.5 * d2 * fpp + d2 * d2 * fppp / 6.0);
+            E[k] += d3;
+        }
+    }
+}
+
+void solve_kepler_danby(const double *M, const double *e, double *E,
+                        size_t n, int n_iter)
+{
+    for (size_t k0 = 0; k0 < n; k0 += BLOCK) {
+        const size_t len = n - k0 < BLOCK ? n - k0 : BLOCK;
+        danby_block(M + k0, e + k0, E + k0, len, n_iter);
+    }
+}
@@ -4,24 +4,33 @@ Aggregate instantaneous results into time-integrated metrics.
 import numpy as np
 
 
-def coverage_fraction(coverage_mask: np.ndarray) -> float:
-    """Return fraction of targets covered by at least one satellite."""
+def coverage_fraction(coverage_mask: np.ndarray):
+    """Return fraction of targets covered by at least one satellite.
+
+    Accepts a single-epoch mask (N_sat, N_tgt), giving a float, or a batched
+    mask (N_sat, T, N_tgt), giving a (T,) array with one fraction per epoch.
+    """
     tgt_covered = np.any(coverage_mask, axis=0)
-    return np.sum(tgt_covered) / tgt_covered.size
+    return np.mean(tgt_covered, axis=-1)
 
 
 def time_statistics(
     time_series: np.ndarray,
     coverage_series: np.ndarray
 ) -> dict:
-    """Compute mean coverage and maximum zero-coverage gap."""
+    """Compute mean coverage and maximum zero-coverage gap.
+
+    The gap is the duration of the longest run of consecutive zero-coverage
+    samples, from its first to its last sample.
+    """
     mean_cov = np.mean(coverage_series)
-    zeros = np.where(coverage_series == 0)[0]
-    if zeros.size > 1:
-        gaps = np.diff(time_series[zeros])
-        max_gap = np.max(gaps)
-    else:
-        max_gap = 0.0
+    is_zero = (coverage_series == 0).view(np.int8)
+    # +1 where a zero run starts, -1 one past where it ends
+    edges = np.diff(np.concatenate(([0], is_zero, [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    gap_durations = time_series[ends - 1] - time_series[starts]
+    max_gap = gap_durations.max() if gap_durations.size else 0.0
     return {
         "mean_coverage": mean_cov,
         "max_zero_coverage_gap_s": max_gap
@@ -18,22 +18,25 @@ def walker_delta(t: int, p: int, f: int, a: float, inc: float, raan0: float=0.0)
         elems: ndarray of shape (t,6) containing [a,e,i,raan,argp,mean_anomaly]
     """
     sats_per_plane = t // p
-    elems = []
-    for i in range(p):
-        raan = raan0 + 2*np.pi * i/p
-        for j in range(sats_per_plane):
-            m0 = 2*np.pi*(j * p + i * f) / t
-            elems.append([a, 0.0, inc, raan, 0.0, m0])
-    return np.array(elems)
+    i_plane = np.arange(p)
+    j_sat = np.arange(sats_per_plane)
+    raan = raan0 + 2*np.pi * i_plane/p                             # (p,)
+    m0 = 2*np.pi*(j_sat[None, :] * p + i_plane[:, None] * f) / t   # (p, sats_per_plane)
+    elems = np.zeros((p * sats_per_plane, 6))
+    elems[:, 0] = a
+    elems[:, 2] = inc
+    elems[:, 3] = np.repeat(raan, sats_per_plane)
+    elems[:, 5] = m0.ravel()
+    return elems
 
 
 def walker_star(num: int, inc: float, a: float):
     """Generate evenly-spaced 'star' pattern."""
-    elems = []
-    for k in range(num):
-        omega = 2*np.pi * k / num
-        elems.append([a, 0.0, inc, omega, 0.0, 0.0])
-    return np.array(elems)
+    elems = np.zeros((num, 6))
+    elems[:, 0] = a
+    elems[:, 2] = inc
+    elems[:, 3] = 2*np.pi * np.arange(num) / num
+    return elems
 
 
 def custom(elements_list):
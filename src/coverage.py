@@ -3,15 +3,44 @@ Check whether each target point lies within any sat's beam cone.
 """
 import numpy as np
 
+# Working-set budget per time block of the coverage series (~ one L2 cache).
+L2_BYTES = 1 << 20
+
 
 def angle_between(u: np.ndarray, v: np.ndarray) -> np.ndarray:
-    """Elementwise angle between vectors (rad)."""
+    """Elementwise angle between vectors (rad).
+
+    General-purpose helper; the coverage functions below compare cosines
+    directly and do not go through it.
+    """
     cosang = np.einsum('...i,...i', u, v) / (
         np.linalg.norm(u, axis=-1) * np.linalg.norm(v, axis=-1)
     )
     return np.arccos(np.clip(cosang, -1.0, 1.0))
 
 
+def _within_cone(los: np.ndarray, cos_thr: float) -> np.ndarray:
+    """Test los_z / |los| >= cos_thr without arccos, sqrt or division.
+
+    The sat boresight is assumed to be +Z in ECI, so the dot product with the
+    boresight collapses to the z-component of the LOS vector. Both sides are
+    squared, with the sign of los_z handled explicitly. A zero-length LOS
+    (sat and target coincide) has no direction and is never inside.
+    """
+    # match the LOS precision: a float64 scalar would promote float32 LOS
+    # arrays to float64 temporaries
+    cos_thr = los.dtype.type(cos_thr)
+    lx, ly, dot = los[..., 0], los[..., 1], los[..., 2]
+    # explicit 3-term sum: cheaper than einsum or (los*los).sum(-1) here
+    norm2 = lx*lx + ly*ly + dot*dot
+    lhs = dot * dot
+    rhs = (cos_thr * cos_thr) * norm2
+    if cos_thr >= 0.0:
+        return (dot >= 0.0) & (lhs >= rhs) & (norm2 > 0.0)
+    # cone wider than a hemisphere: every forward LOS is inside
+    return ((dot >= 0.0) | (lhs <= rhs)) & (norm2 > 0.0)
+
+
 def instantaneous_coverage(
     sat_pos: np.ndarray,       # (N_sat,3)
     tgt_pos: np.ndarray,       # (N_tgt,3)
@@ -21,9 +50,49 @@ def instantaneous_coverage(
     """Returns boolean mask (N_sat, N_tgt) indicating coverage."""
     # LOS vectors: (N_sat,1,3) - (1,N_tgt,3) → (N_sat, N_tgt,3)
     los = sat_pos[:, None, :] - tgt_pos[None, :, :]
-    # assume sat boresight is +Z in ECI for now
-    boresight = np.array([0, 0, 1.0])
-    boresight = boresight[None, None, :]  # broadcast
-    ang = angle_between(los, boresight)  # (N_sat, N_tgt)
-    return ang <= np.minimum(divergence, scan_angle)
+    cos_thr = np.cos(min(divergence, scan_angle))
+    return _within_cone(los, cos_thr)
+
+
+def instantaneous_coverage_batched(
+    sat_pos: np.ndarray,       # (N_sat,T,3)
+    tgt_pos: np.ndarray,       # (N_tgt,T,3)
+    cos_thr: float             # cos of the effective cone half-angle
+) -> np.ndarray:
+    """Returns boolean mask (N_sat, T, N_tgt) indicating coverage at every epoch.
+
+    Same cone test as `instantaneous_coverage`, evaluated over the whole time
+    grid in one pass. The threshold is passed as
+    cos(min(divergence, scan_angle)) so callers compute it once per run.
+    """
+    # LOS vectors: (N_sat,T,1,3) - (1,T,N_tgt,3) → (N_sat,T,N_tgt,3)
+    los = sat_pos[:, :, None, :] - tgt_pos.transpose(1, 0, 2)[None, :, :, :]
+    return _within_cone(los, cos_thr)
+
+
+def coverage_time_series(
+    sat_pos: np.ndarray,       # (N_sat,T,3)
+    tgt_pos: np.ndarray,       # (N_tgt,T,3)
+    cos_thr: float,            # cos of the effective cone half-angle
+    t_block: int = None,
+    out: np.ndarray = None     # (T,) preallocated result buffer
+) -> np.ndarray:
+    """Returns (T,) fraction of targets covered by at least one sat at each epoch.
 
+    The time axis is processed in blocks of `t_block` epochs so the LOS tensor
+    of a block stays within `L2_BYTES`; the full (N_sat, T, N_tgt, 3) tensor
+    is never materialized. Each block is reduced straight into `out`
+    (allocated if not given), so no per-block results are collected.
+    """
+    n_sat, n_t, _ = sat_pos.shape
+    n_tgt = tgt_pos.shape[0]
+    if t_block is None:
+        t_block = max(1, L2_BYTES // (max(1, n_sat * n_tgt) * 3 * sat_pos.itemsize))
+    cov_frac = np.empty(n_t) if out is None else out
+    for t0 in range(0, n_t, t_block):
+        t1 = min(t0 + t_block, n_t)
+        mask = instantaneous_coverage_batched(
+            sat_pos[:, t0:t1], tgt_pos[:, t0:t1], cos_thr
+        )
+        np.mean(mask.any(axis=0), axis=-1, out=cov_frac[t0:t1])
+    return cov_frac
@@ -1,46 +1,205 @@
 """
-Analytical (Keplerian) propagator using mean elements + Newton-Raphson.
+Analytical (Keplerian) propagator using mean elements + Danby iteration.
 """
+import ctypes
+import math
+import os
+
 import numpy as np
-from tudatpy.kernel import constants
-from tudatpy.kernel.astro import element_conversion
-
-
-def solve_kepler(M, e, tol=1e-8, max_iter=50):
-    E = M.copy()
-    for _ in range(max_iter):
-        f = E - e*np.sin(E) - M
-        f_prime = 1 - e*np.cos(E)
-        dE = -f / f_prime
-        E += dE
-        if np.all(np.abs(dE) < tol):
-            break
+
+try:
+    from tudatpy.kernel import constants
+    MU_EARTH = constants.GRAVITATIONAL_PARAMETER_EARTH
+except ImportError:
+    MU_EARTH = 3.986004418e14  # [m^3/s^2], same value as tudatpy's constant
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _load_kepler_c():
+    """Load the optional compiled Danby solver (src/_kepler_c.c), if built."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_kepler_c.so")
+    try:
+        lib = ctypes.CDLL(path)
+    except OSError:
+        return None
+    fn = lib.solve_kepler_danby
+    dbl_p = ctypes.POINTER(ctypes.c_double)
+    fn.argtypes = [dbl_p, dbl_p, dbl_p, ctypes.c_size_t, ctypes.c_int]
+    fn.restype = None
+    return fn
+
+
+_kepler_c = _load_kepler_c()
+
+
+if numba is not None:
+    @numba.njit(inline='always', fastmath=True, cache=True)
+    def _danby_nb(M, e, n_iter):
+        """Scalar Danby iteration; same update as the NumPy path."""
+        s = math.sin(M)
+        E = M + 0.85*e*np.sign(s)
+        for _ in range(n_iter):
+            s = math.sin(E)
+            c = math.cos(E)
+            f = E - e*s - M
+            fp = 1.0 - e*c
+            fpp = e*s
+            fppp = e*c
+            d1 = -f / fp
+            d2 = -f / (fp + 0.5*d1*fpp)
+            d3 = -f / (fp + 0.5*d2*fpp + d2*d2*fppp/6.0)
+            E += d3
+        return E
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _solve_kepler_nb(M, e, E_out, n_iter):
+        """Solve Kepler's equation elementwise over flat arrays into E_out."""
+        for k in numba.prange(M.size):
+            E_out[k] = _danby_nb(M[k], e[k], n_iter)
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _propagate_nb(a, e, m0, n, P, Q, times, out):
+        """Fused mean anomaly -> Kepler -> perifocal -> ECI kernel.
+
+        Fills out (N, T, 3) without materializing any (N, T) intermediate,
+        using the per-satellite basis vectors from `perifocal_basis`.
+        """
+        for sat in numba.prange(a.size):
+            Px, Py, Pz = P[sat, 0], P[sat, 1], P[sat, 2]
+            Qx, Qy, Qz = Q[sat, 0], Q[sat, 1], Q[sat, 2]
+            a_s, e_s = a[sat], e[sat]
+            b_s = a_s*math.sqrt(1.0 - e_s*e_s)
+            circular = e_s == 0.0
+            for k in range(times.size):
+                M = m0[sat] + n[sat]*times[k]
+                # circular orbits: E == M, no Kepler solve needed
+                E = M if circular else _danby_nb(M, e_s, 5)
+                xp = a_s*(math.cos(E) - e_s)
+                yp = b_s*math.sin(E)
+                out[sat, k, 0] = xp*Px + yp*Qx
+                out[sat, k, 1] = xp*Py + yp*Qy
+                out[sat, k, 2] = xp*Pz + yp*Qz
+
+
+def solve_kepler(M: np.ndarray, e, n_iter: int = 5) -> np.ndarray:
+    """Solve Kepler's equation M = E - e*sin(E) for the eccentric anomaly.
+
+    Uses Danby's quartic-convergent iteration from the seed
+    E0 = M + 0.85*e*sign(sin M). A fixed number of iterations is run with no
+    convergence check; five are enough to reach machine precision for e < 0.99.
+    The iteration runs in the compiled SIMD kernel from src/_kepler_c.c when
+    it has been built, otherwise in a fused numba kernel when numba is
+    installed, and only falls back to NumPy temporaries without either.
+
+    Args:
+        M: mean anomaly [rad], any shape (e.g. (N, T))
+        e: eccentricity, broadcastable to M
+        n_iter: number of Danby iterations
+
+    Returns:
+        E: eccentric anomaly [rad], same shape as M
+    """
+    e = np.broadcast_to(e, M.shape)
+    if _kepler_c is not None or numba is not None:
+        M_flat = np.ascontiguousarray(M, dtype=np.float64).ravel()
+        e_flat = np.ascontiguousarray(e, dtype=np.float64).ravel()
+        E = np.empty_like(M_flat)
+        if _kepler_c is not None:
+            dbl_p = ctypes.POINTER(ctypes.c_double)
+            _kepler_c(M_flat.ctypes.data_as(dbl_p), e_flat.ctypes.data_as(dbl_p),
+                      E.ctypes.data_as(dbl_p), E.size, n_iter)
+        else:
+            _solve_kepler_nb(M_flat, e_flat, E, n_iter)
+        return E.reshape(M.shape)
+
+    E = M + 0.85*e*np.sign(np.sin(M))
+    for _ in range(n_iter):
+        s, c = np.sin(E), np.cos(E)
+        f = E - e*s - M
+        fp = 1 - e*c
+        fpp = e*s
+        fppp = e*c
+        d1 = -f / fp
+        d2 = -f / (fp + 0.5*d1*fpp)
+        d3 = -f / (fp + 0.5*d2*fpp + d2*d2*fppp/6)
+        E += d3
     return E
 
 
+def perifocal_basis(i: np.ndarray, raan: np.ndarray, argp: np.ndarray):
+    """In-plane perifocal axes expressed in ECI (3-1-3 rotation: raan, i, argp).
+
+    These are the first two columns of the perifocal-to-ECI rotation matrix;
+    the third is never needed because perifocal z is zero. They depend only on
+    the orientation angles, so their trig is evaluated once per orbit and
+    reused for every epoch.
+
+    Args:
+        i: (N,) inclination [rad]
+        raan: (N,) right ascension of the ascending node [rad]
+        argp: (N,) argument of periapsis [rad]
+
+    Returns:
+        P: (N, 3) unit vectors towards periapsis
+        Q: (N, 3) unit vectors 90 deg ahead of periapsis in the orbit plane
+    """
+    ci, si = np.cos(i), np.sin(i)
+    cO, sO = np.cos(raan), np.sin(raan)
+    cw, sw = np.cos(argp), np.sin(argp)
+    P = np.stack([cO*cw - sO*sw*ci, sO*cw + cO*sw*ci, sw*si], axis=-1)
+    Q = np.stack([-cO*sw - sO*cw*ci, -sO*sw + cO*cw*ci, cw*si], axis=-1)
+    return P, Q
+
+
 def propagate_keplerian(elems: np.ndarray, times: np.ndarray,
-                        mu: float = constants.GRAVITATIONAL_PARAMETER_EARTH) -> np.ndarray:
+                        mu: float = MU_EARTH,
+                        dtype=np.float32) -> np.ndarray:
     """Propagate keplerian orbits using mean elements.
 
+    All satellites and epochs are handled at once: Kepler's equation is
+    solved on the (N, T) mean-anomaly grid, positions are formed in the
+    perifocal frame and mapped to ECI with per-satellite basis vectors. With
+    numba installed these steps are fused into a single kernel; only
+    eccentric sets on a single numba thread go through the C solver instead,
+    when it is built. Circular orbits (e == 0) take E = M directly.
+
+    Anomalies are always solved in float64; only the perifocal/ECI stage and
+    the returned positions use `dtype`. Single precision (metre-level error at
+    LEO radii) is plenty for coverage and halves the memory traffic of every
+    downstream array; pass dtype=np.float64 for validation runs.
+
     Args:
         elems: (N,6) array of [a,e,i,raan,argp,m0] at t0=0
         times: (T,) array of seconds since t0
         mu: gravitational parameter [m^3/s^2]
+        dtype: floating type of the returned positions
 
     Returns:
         positions: (N, T, 3) ECI positions [m]
     """
-    a, e, i, raan, argp, m0 = elems.T
+    # one contiguous row per element (SoA) for the kernels below
+    a, e, i, raan, argp, m0 = np.ascontiguousarray(elems.T, dtype=np.float64)
     n = np.sqrt(mu / a**3)
-    positions = np.zeros((elems.shape[0], times.size, 3))
-    for idx, t in enumerate(times):
-        M = m0 + n * t
-        E = solve_kepler(M, e)
-        # convert each sat
-        for sat in range(elems.shape[0]):
-            r_ijk = element_conversion.keplerian_to_cartesian(
-                a[sat], e[sat], i[sat], raan[sat], argp[sat], E[sat], mu
-            )
-            positions[sat, idx, :] = r_ijk
-    return positions
+    P, Q = perifocal_basis(i, raan, argp)  # time-invariant, (N,3) each
+    positions = np.empty((a.size, times.size, 3), dtype=dtype)
+    # the C solver only pays off when there is a Kepler solve to do, and it
+    # has only been measured faster than the fused kernel single-threaded
+    # (the C solver is serial, the fused kernel runs over prange)
+    if numba is not None and (_kepler_c is None or not e.any()
+                              or numba.get_num_threads() > 1):
+        _propagate_nb(a, e, m0, n, P, Q,
+                      np.ascontiguousarray(times, dtype=np.float64), positions)
+        return positions
 
+    M = m0[:, None] + n[:, None] * times[None, :]  # (N,T)
+    # all-circular sets (Walker shells, circular targets) skip the Kepler solve
+    E = solve_kepler(M, e[:, None]) if e.any() else M
+    xp = (a[:, None] * (np.cos(E) - e[:, None])).astype(dtype)
+    yp = ((a * np.sqrt(1 - e**2))[:, None] * np.sin(E)).astype(dtype)
+    np.multiply(xp[:, :, None], P[:, None, :].astype(dtype), out=positions)
+    positions += yp[:, :, None] * Q[:, None, :].astype(dtype)
+    return positions
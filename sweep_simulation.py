@@ -7,10 +7,17 @@ import argparse
 
 from src.constellation import walker_delta, walker_star
 from src.propagation import propagate_keplerian
-from src.coverage import instantaneous_coverage
-from src.analysis import coverage_fraction, time_statistics
+from src.coverage import coverage_time_series
+from src.analysis import time_statistics
+from src.propagation_cuda import available as gpu_available
+from src.propagation_cuda import propagate_keplerian_gpu, coverage_time_series_gpu
 from src.utils import make_time_grid
 
+try:
+    from joblib import Parallel, delayed
+except ImportError:
+    Parallel = None
+
 try:
     import matplotlib.pyplot as plt
     from mpl_toolkits.mplot3d import Axes3D  # noqa: F401
@@ -28,23 +35,30 @@ def build_constellation(config: str, n_sat: int, altitude_m: float, inc_deg: flo
         return walker_delta(t=n_sat, p=p, f=1, a=altitude_m, inc=np.deg2rad(inc_deg))
 
 
-def run_single_sim(elems: np.ndarray, tgt_elems: np.ndarray, scan_half_angle_deg: float) -> dict:
-    times = make_time_grid(0.0, 5400.0, 60.0)  # 1.5 hours
-    sat_pos = propagate_keplerian(elems, times)
-    tgt_pos = propagate_keplerian(tgt_elems, times)
-
-    cov_series = []
-    for k, _ in enumerate(times):
-        mask = instantaneous_coverage(
-            sat_pos[:, k, :], tgt_pos[:, k, :],
-            np.deg2rad(scan_half_angle_deg), np.deg2rad(scan_half_angle_deg)
-        )
-        cov_series.append(coverage_fraction(mask))
-    cov_series = np.array(cov_series)
+def run_single_sim(elems: np.ndarray, tgt_pos: np.ndarray, times: np.ndarray,
+                   scan_half_angle_deg: float, gpu: bool = False) -> dict:
+    """Propagate one constellation and score it against pre-propagated targets."""
+    cos_thr = np.cos(np.deg2rad(scan_half_angle_deg))
+    if gpu:
+        sat_pos = propagate_keplerian_gpu(elems, times)
+        cov_series = coverage_time_series_gpu(sat_pos, tgt_pos, cos_thr)
+    else:
+        sat_pos = propagate_keplerian(elems, times)
+        cov_series = coverage_time_series(sat_pos, tgt_pos, cos_thr)
     stats = time_statistics(times, cov_series)
     return {"stats": stats, "series": cov_series}
 
 
+def _sweep_point(cfg: str, alt_km: int, n: int, tgt_pos: np.ndarray, times: np.ndarray,
+                 inc_deg: float, scan_angle: float, power_w: float, gpu: bool = False) -> dict:
+    """Build, propagate and score one sweep point; safe to run in a worker process."""
+    a_m = alt_km * 1e3 + 6371e3
+    elems = build_constellation(cfg, n, a_m, inc_deg)
+    stat = run_single_sim(elems, tgt_pos, times, scan_angle, gpu)["stats"]
+    stat.update({"config": cfg, "altitude_km": alt_km, "satellites": n, "power_w": power_w})
+    return stat
+
+
 def plot_constellation(elems: np.ndarray, outdir: str, scan_half_angle_deg: float):
     if plt is None:
         print("matplotlib not available; skipping plot")
@@ -76,7 +90,7 @@ def plot_constellation(elems: np.ndarray, outdir: str, scan_half_angle_deg: floa
     plt.close(fig)
 
 
-def main(outdir: str, plot: bool):
+def main(outdir: str, plot: bool, n_jobs: int = -1, gpu: bool = False):
     os.makedirs(outdir, exist_ok=True)
 
     inc_deg = 53.0
@@ -84,26 +98,35 @@ def main(outdir: str, plot: bool):
     power_w = 30.0
 
     tgt_elems = np.array([[7000e3, 0.0, 0.0, 0.0, 0.0, 0.0]])
+    # targets are the same for every sweep point: propagate them once
+    times = make_time_grid(0.0, 5400.0, 60.0)  # 1.5 hours
+    tgt_pos = propagate_keplerian(tgt_elems, times)
 
     # Sweep altitudes from 300 km up to 1000 km in 100 km steps
     altitudes_km = np.arange(300, 1001, 100)
     sat_counts = np.arange(30, 1001, 50)
     configs = ["delta", "star"]
 
-    summary = []
-
-    for cfg in configs:
-        for alt_km in altitudes_km:
-            for n in sat_counts:
-                a_m = alt_km * 1e3 + 6371e3
-                elems = build_constellation(cfg, n, a_m, inc_deg)
-                res = run_single_sim(elems, tgt_elems, scan_angle)
-                stat = res["stats"]
-                stat.update({"config": cfg, "altitude_km": alt_km, "satellites": n, "power_w": power_w})
-                summary.append(stat)
-                if plot:
-                    subdir = os.path.join(outdir, f"{cfg}_{n}sats_{alt_km}km")
-                    plot_constellation(elems, subdir, scan_angle)
+    # plain ints so the summary stays JSON-serializable
+    points = [(cfg, int(alt_km), int(n))
+              for cfg in configs for alt_km in altitudes_km for n in sat_counts]
+    args = (tgt_pos, times, inc_deg, scan_angle, power_w, gpu)
+
+    # sweep points are independent: farm them out to all cores when joblib is
+    # available (the GPU backend runs serially and keeps the device busy itself)
+    if Parallel is not None and n_jobs != 1 and not gpu:
+        summary = Parallel(n_jobs=n_jobs, backend="loky")(
+            delayed(_sweep_point)(cfg, alt_km, n, *args) for cfg, alt_km, n in points
+        )
+    else:
+        summary = [_sweep_point(cfg, alt_km, n, *args) for cfg, alt_km, n in points]
+
+    # plotting stays in the main process
+    if plot:
+        for cfg, alt_km, n in points:
+            elems = build_constellation(cfg, n, alt_km * 1e3 + 6371e3, inc_deg)
+            subdir = os.path.join(outdir, f"{cfg}_{n}sats_{alt_km}km")
+            plot_constellation(elems, subdir, scan_angle)
 
     # save statistics
     import json
@@ -116,5 +139,10 @@ if __name__ == "__main__":
     ap = argparse.ArgumentParser(description="Run constellation sweep simulations")
     ap.add_argument("--outdir", default="sweep_results", help="directory for results")
     ap.add_argument("--plot", action="store_true", help="save 3D constellation plots")
+    ap.add_argument("--jobs", type=int, default=-1,
+                    help="parallel worker processes (-1: all cores, 1: serial; needs joblib)")
+    ap.add_argument("--gpu", action="store_true", help="use the CUDA backend (needs cupy)")
     args = ap.parse_args()
-    main(args.outdir, args.plot)
+    if args.gpu and not gpu_available():
+        ap.error("--gpu requested but cupy or a CUDA device is not available")
+    main(args.outdir, args.plot, args.jobs, args.gpu)